@@ -1,5 +1,6 @@
 import collections
 import copy
+import functools
 import json
 import logging
 import os
@@ -25,6 +26,15 @@ BASE_SCHEMA = {
 }
 
 
+@functools.lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """
+    Split a 'dotdict' key into its parts. The same handful of keys is
+    looked up over and over, so the split is cached per key.
+    """
+    return tuple(key.split('.'))
+
+
 class Config:
     """
     QCoDeS config system
@@ -401,7 +411,7 @@ class Config:
 
     def __getitem__(self, name: str) -> Any:
         val = self.current_config
-        for key in name.split('.'):
+        for key in _split_key(name):
             if val is None:
                 raise KeyError(f"{name} not found in current config")
             val = val[key]
@@ -433,28 +443,34 @@ class DotDict(Dict[Any, Any]):
                 self.__setitem__(key, value[key])
 
     def __setitem__(self, key: str, value: Any) -> None:
+        target: Dict[Any, Any] = self
         if '.' in key:
-            myKey, restOfKey = key.split('.', 1)
-            target = self.setdefault(myKey, DotDict())
-            target[restOfKey] = value
-        else:
-            if isinstance(value, dict) and not isinstance(value, DotDict):
-                value = DotDict(value)
-            dict.__setitem__(self, key, value)
+            *parents, key = _split_key(key)
+            for parent in parents:
+                # a single lookup per level that also creates missing levels
+                target = target.setdefault(parent, DotDict())
+        if isinstance(value, dict) and not isinstance(value, DotDict):
+            value = DotDict(value)
+        dict.__setitem__(target, key, value)
 
     def __getitem__(self, key: str) -> Any:
         if '.' not in key:
             return dict.__getitem__(self, key)
-        myKey, restOfKey = key.split('.', 1)
-        target = dict.__getitem__(self, myKey)
-        return target[restOfKey]
+        target: Any = self
+        for part in _split_key(key):
+            target = target[part]
+        return target
 
     def __contains__(self, key: str) -> bool:  # type: ignore[override]
         if '.' not in key:
             return dict.__contains__(self, key)
-        myKey, restOfKey = key.split('.', 1)
-        target = dict.__getitem__(self, myKey)
-        return restOfKey in target
+        *parents, key = _split_key(key)
+        target: Any = self
+        for parent in parents:
+            target = dict.get(target, parent)
+            if not isinstance(target, dict):
+                return False
+        return dict.__contains__(target, key)
 
     def __deepcopy__(self, memo: Optional[Dict[Any, Any]]) -> 'DotDict':
         return DotDict(copy.deepcopy(dict(self)))
@@ -463,6 +479,10 @@ class DotDict(Dict[Any, Any]):
         """
         Overwrite ``__getattr__`` to provide dot access
         """
+        if '.' not in name:
+            # plain attribute access never has a dot in the name, so skip
+            # the extra ``__getitem__`` call and look up the key directly
+            return dict.__getitem__(self, name)
         return self.__getitem__(name)
 
     def __setattr__(self, key: str, value: Any) -> None:
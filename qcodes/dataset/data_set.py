@@ -5,7 +5,6 @@ import logging
 import warnings
 import os
 import time
-import uuid
 from dataclasses import dataclass
 from queue import Empty, Queue
 from threading import Thread
@@ -1375,7 +1374,8 @@ class DataSet(Sized):
                   state: Optional[Any] = None,
                   callback_kwargs: Optional[Mapping[str, Any]] = None
                   ) -> str:
-        subscriber_id = uuid.uuid4().hex
+        # only used as an opaque token, so skip constructing a UUID object
+        subscriber_id = os.urandom(16).hex()
         subscriber = _Subscriber(self, subscriber_id, callback, state,
                                  min_wait, min_count, callback_kwargs)
         self.subscribers[subscriber_id] = subscriber
@@ -4,7 +4,7 @@ import weakref
 import logging
 from abc import ABC, abstractmethod
 from typing import Sequence, Optional, Dict, Union, Callable, Any, List, \
-    TYPE_CHECKING, cast, Type
+    TYPE_CHECKING, cast, Type, Iterable, Tuple, Mapping, Set
 
 import numpy as np
 from qcodes.utils.helpers import DelegateAttributes, strip_attrs, full_class
@@ -20,6 +20,22 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# ``Anything`` holds no state, so all IDN parameters can share one instance
+_IDN_VALIDATOR = Anything()
+
+
+def _check_new_names(names: Sequence[str], existing: Mapping[str, Any],
+                     kind: str) -> None:
+    """
+    Raise a ``KeyError`` for the first name in ``names`` that is already in
+    ``existing`` or that occurs more than once in ``names``.
+    """
+    seen: Set[str] = set()
+    for name in names:
+        if name in existing or name in seen:
+            raise KeyError(f'Duplicate {kind} name {name}')
+        seen.add(name)
+
 
 class InstrumentBase(Metadatable, DelegateAttributes):
     """
@@ -129,6 +145,62 @@ class InstrumentBase(Metadatable, DelegateAttributes):
         func = Function(name=name, instrument=self, **kwargs)
         self.functions[name] = func
 
+    def add_parameters(self,
+                       specs: Iterable[Tuple[str, Dict[str, Any]]],
+                       parameter_class: type = Parameter) -> None:
+        """
+        Bind several Parameters of the same class to this instrument at once.
+
+        This is equivalent to calling :py:meth:`add_parameter` for every
+        ``(name, kwargs)`` pair in ``specs``, but all names are checked for
+        duplicates and all parameters are constructed before any of them is
+        added, so either all parameters are added or none are.
+
+        Args:
+            specs: Pairs of parameter name and the constructor arguments for
+                ``parameter_class``.
+            parameter_class: You can construct the parameters
+                out of any class. Default :class:`.parameter.Parameter`.
+
+        Raises:
+            KeyError: If this instrument already has a parameter with any of
+                these names, or if a name occurs more than once in ``specs``.
+        """
+        specs = list(specs)
+        _check_new_names([name for name, _ in specs], self.parameters,
+                         'parameter')
+        # construct everything before registering anything, so that an
+        # error in any constructor leaves the instrument untouched
+        new_params = {name: parameter_class(name=name, instrument=self,
+                                            **kwargs)
+                      for name, kwargs in specs}
+        self.parameters.update(new_params)
+
+    def add_functions(self,
+                      specs: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        Bind several ``Function`` objects to this instrument at once.
+
+        This is equivalent to calling :py:meth:`add_function` for every
+        ``(name, kwargs)`` pair in ``specs``, but all names are checked for
+        duplicates and all functions are constructed before any of them is
+        added, so either all functions are added or none are.
+
+        Args:
+            specs: Pairs of function name and the constructor kwargs for
+                ``Function``.
+
+        Raises:
+            KeyError: If this instrument already has a function with any of
+                these names, or if a name occurs more than once in ``specs``.
+        """
+        specs = list(specs)
+        _check_new_names([name for name, _ in specs], self.functions,
+                         'function')
+        new_funcs = {name: Function(name=name, instrument=self, **kwargs)
+                     for name, kwargs in specs}
+        self.functions.update(new_funcs)
+
     def add_submodule(self, name: str,
                       submodule:  Union['InstrumentBase',
                                         'ChannelList']) -> None:
@@ -188,8 +260,8 @@ class InstrumentBase(Metadatable, DelegateAttributes):
             dict: base snapshot
         """
 
-        if params_to_skip_update is None:
-            params_to_skip_update = []
+        # a set makes the membership test below O(1) per parameter
+        skip_update = frozenset(params_to_skip_update or ())
 
         snap: Dict[str, Any] = {
             "functions": {name: func.snapshot(update=update)
@@ -199,27 +271,28 @@ class InstrumentBase(Metadatable, DelegateAttributes):
             "__class__": full_class(self)
         }
 
-        snap['parameters'] = {}
+        params_snap: Dict[str, Any] = {}
+        snap['parameters'] = params_snap
         for name, param in self.parameters.items():
             if param.snapshot_exclude:
                 continue
-            if params_to_skip_update and name in params_to_skip_update:
-                update_par: Optional[bool] = False
-            else:
-                update_par = update
+            update_par = False if name in skip_update else update
             try:
-                snap['parameters'][name] = param.snapshot(update=update_par)
+                params_snap[name] = param.snapshot(update=update_par)
             except:
                 # really log this twice. Once verbose for the UI and once
                 # at lower level with more info for file based loggers
                 self.log.warning(f"Snapshot: Could not update "
                                  f"parameter: {name}")
                 self.log.info(f"Details for Snapshot:", exc_info=True)
-                snap['parameters'][name] = param.snapshot(update=False)
+                params_snap[name] = param.snapshot(update=False)
 
         for attr in set(self._meta_attrs):
-            if hasattr(self, attr):
+            # a single lookup instead of ``hasattr`` followed by ``getattr``
+            try:
                 snap[attr] = getattr(self, attr)
+            except AttributeError:
+                pass
         return snap
 
     def print_readable_snapshot(self, update: bool = False,
@@ -333,6 +406,10 @@ class InstrumentBase(Metadatable, DelegateAttributes):
         """
         Shortcut for setting a parameter from its name and new value.
 
+        This looks the parameter up by name on every call. In tight loops,
+        look it up once with ``param = instrument.parameters[param_name]``
+        and call ``param.set(value)`` directly instead.
+
         Args:
             param_name: The name of a parameter of this instrument.
             value: The new value to set.
@@ -343,6 +420,10 @@ class InstrumentBase(Metadatable, DelegateAttributes):
         """
         Shortcut for getting a parameter from its name.
 
+        This looks the parameter up by name on every call. In tight loops,
+        look it up once with ``param = instrument.parameters[param_name]``
+        and call ``param.get()`` directly instead.
+
         Args:
             param_name: The name of a parameter of this instrument.
 
@@ -413,9 +494,28 @@ class Instrument(InstrumentBase, AbstractInstrument):
 
     shared_kwargs = ()
 
+    _strip_attrs_on_close = True
+    """
+    Whether :meth:`close` removes all instance attributes to break reference
+    cycles. Subclasses whose attributes hold no such references (e.g. simple
+    mocks created in large numbers) can set this to ``False`` to make
+    closing cheaper.
+    """
+
+    # Entries are evicted by a weakref callback when an instrument is garbage
+    # collected, which can happen at any allocation. Never iterate over this
+    # dict directly: iterate over a snapshot of its keys (``list(...)``) and
+    # look entries up with ``.get``.
     _all_instruments: "Dict[str, weakref.ref[Instrument]]" = {}
-    _type = None
-    _instances: "List[weakref.ref[Instrument]]" = []
+    _instances: "weakref.WeakValueDictionary[int, Instrument]" = \
+        weakref.WeakValueDictionary()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Every subclass gets its own instance record when the class is
+        # created, so that we never record an instance in a base class
+        # instance set and don't need to check for that on every call.
+        cls._instances = weakref.WeakValueDictionary()
 
     def __init__(self, name: str,
                  metadata: Optional[Dict[Any, Any]] = None) -> None:
@@ -424,7 +524,7 @@ class Instrument(InstrumentBase, AbstractInstrument):
         super().__init__(name, metadata)
 
         self.add_parameter('IDN', get_cmd=self.get_idn,
-                           vals=Anything())
+                           vals=_IDN_VALIDATOR)
 
         self.record_instance(self)
 
@@ -515,7 +615,8 @@ class Instrument(InstrumentBase, AbstractInstrument):
         if hasattr(self, 'connection') and hasattr(self.connection, 'close'):
             self.connection.close()
 
-        strip_attrs(self, whitelist=['_name'])
+        if self._strip_attrs_on_close:
+            strip_attrs(self, whitelist=['_name'])
         self.remove_instance(self)
 
     @classmethod
@@ -533,6 +634,10 @@ class Instrument(InstrumentBase, AbstractInstrument):
         for inststr in list(cls._all_instruments):
             try:
                 inst = cls.find_instrument(inststr)
+            except KeyError:
+                # garbage collected after we took the list of names
+                continue
+            try:
                 log.info(f"Closing {inststr}")
                 inst.close()
             except:
@@ -542,7 +647,7 @@ class Instrument(InstrumentBase, AbstractInstrument):
     @classmethod
     def record_instance(cls, instance: 'Instrument') -> None:
         """
-        Record (a weak ref to) an instance in a class's instance list.
+        Record (a weak ref to) an instance in a class's instance record.
 
         Also records the instance in list of *all* instruments, and verifies
         that there are no other instruments with the same name.
@@ -553,22 +658,30 @@ class Instrument(InstrumentBase, AbstractInstrument):
         Raises:
             KeyError: If another instance with the same name is already present.
         """
-        wr = weakref.ref(instance)
         name = instance.name
+        all_ins = cls._all_instruments
+
+        def drop_dead_ref(dead_wr: 'weakref.ref[Instrument]') -> None:
+            # evict the record as soon as the instrument is garbage
+            # collected, unless the name has been taken over in the meantime
+            if all_ins.get(name) is dead_wr:
+                all_ins.pop(name, None)
+
+        # the callback runs whenever the garbage collector does, see the
+        # note on ``_all_instruments``
+        wr = weakref.ref(instance, drop_dead_ref)
         # First insert this instrument in the record of *all* instruments
         # making sure its name is unique
-        existing_wr = cls._all_instruments.get(name)
+        existing_wr = all_ins.get(name)
         if existing_wr and existing_wr():
             raise KeyError(f'Another instrument has the name: {name}')
 
-        cls._all_instruments[name] = wr
+        all_ins[name] = wr
 
-        # Then add it to the record for this specific subclass, using ``_type``
-        # to make sure we're not recording it in a base class instance list
-        if getattr(cls, '_type', None) is not cls:
-            cls._type = cls
-            cls._instances = []
-        cls._instances.append(wr)
+        # Then add it to the record for this specific subclass. This is keyed
+        # by ``id`` so that it keeps the creation order and does not depend
+        # on instruments being hashable.
+        cls._instances[id(instance)] = instance
 
     @classmethod
     def instances(cls) -> List['Instrument']:
@@ -581,11 +694,9 @@ class Instrument(InstrumentBase, AbstractInstrument):
         Returns:
             A list of instances.
         """
-        if getattr(cls, '_type', None) is not cls:
-            # only instances of a superclass - we want instances of this
-            # exact class only
-            return []
-        return [wr() for wr in getattr(cls, '_instances', []) if wr()]
+        # each class has its own instance record (see ``__init_subclass__``)
+        # so this only holds instances of this exact class
+        return list(cls._instances.values())
 
     @classmethod
     def remove_instance(cls, instance: 'Instrument') -> None:
@@ -595,16 +706,32 @@ class Instrument(InstrumentBase, AbstractInstrument):
         Args:
             instance: The instance to remove
         """
-        wr = weakref.ref(instance)
-        if wr in getattr(cls, "_instances", []):
-            cls._instances.remove(wr)
-
-        # remove from all_instruments too, but don't depend on the
-        # name to do it, in case name has changed or been deleted
+        # This may be called from ``__del__`` while the instance is being
+        # finalized, so neither record is looked up through a new weakref to
+        # the instance. The per-class record is keyed by ``id`` and drops
+        # dead entries by itself, so only live instances that are closed
+        # explicitly need to be removed here. If the instance is not in it,
+        # it was already closed or collected, and its entry in
+        # ``_all_instruments`` is gone too, so there is nothing to scan for.
+        if cls._instances.pop(id(instance), None) is None:
+            return
+
+        # remove from all_instruments too, comparing referents. Try the name
+        # first, but don't depend on it, in case name has changed or been
+        # deleted.
         all_ins = cls._all_instruments
-        for name, ref in list(all_ins.items()):
-            if ref is wr:
+        name = getattr(instance, '_name', None)
+        if name is not None:
+            ref = all_ins.get(name)
+            if ref is not None and ref() is instance:
                 del all_ins[name]
+                return
+        # iterate over a snapshot of the names, since entries can be
+        # evicted by garbage collection at any time (see ``record_instance``)
+        for name in list(all_ins):
+            ref = all_ins.get(name)
+            if ref is not None and ref() is instance:
+                all_ins.pop(name, None)
 
     @classmethod
     def find_instrument(cls, name: str,
@@ -620,16 +747,15 @@ class Instrument(InstrumentBase, AbstractInstrument):
             The instrument found.
 
         Raises:
-            KeyError: If no instrument of that name was found, or if its
-                reference is invalid (dead).
+            KeyError: If no instrument of that name was found. This includes
+                instruments that were garbage collected without being
+                closed, since those are removed from the registry when they
+                are collected.
             TypeError: If a specific class was requested but a different
                 type was found.
         """
         ins = cls._all_instruments[name]()
 
-        if ins is None:
-            del cls._all_instruments[name]
-            raise KeyError(f'Instrument {name} has been removed')
         if instrument_class is not None:
             if not isinstance(ins, instrument_class):
                 raise TypeError(
@@ -655,9 +781,7 @@ class Instrument(InstrumentBase, AbstractInstrument):
                 name, instrument_class=instrument_class)
 
         except KeyError as exception:
-            instrument_is_not_found = \
-                any(str_ in str(exception)
-                    for str_ in [name, 'has been removed'])
+            instrument_is_not_found = name in str(exception)
 
             if instrument_is_not_found:
                 instrument_exists = False
@@ -744,10 +868,7 @@ class Instrument(InstrumentBase, AbstractInstrument):
                 including the command and the instrument.
         """
         try:
-            answer = self.ask_raw(cmd)
-
-            return answer
-
+            return self.ask_raw(cmd)
         except Exception as e:
             inst = repr(self)
             e.args = e.args + ('asking ' + repr(cmd) + ' to ' + inst,)
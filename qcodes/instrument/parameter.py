@@ -695,13 +695,15 @@ class _BaseParameter(Metadatable):
             ValueError: If the value is outside the bounds specified by the
                validator.
         """
+        if self.vals is None:
+            # nothing to validate, so don't build the context string either
+            return
         if self._instrument:
             context = (getattr(self._instrument, 'name', '') or
                        str(self._instrument.__class__)) + '.' + self.name
         else:
             context = self.name
-        if self.vals is not None:
-            self.vals.validate(value, 'Parameter: ' + context)
+        self.vals.validate(value, 'Parameter: ' + context)
 
     @property
     def step(self) -> Optional[float]:
@@ -208,7 +208,7 @@ class Monitor(Thread):
             self.server.close()
         log.debug("waiting for server to close")
         if self.loop is not None and self.server is not None:
-            await self.loop.create_task(self.server.wait_closed())
+            await self.server.wait_closed()
         log.debug("stopping loop")
         if self.loop is not None:
             log.debug("Pending tasks at stop: %r",
@@ -58,3 +58,16 @@ def test_pathological():
 
     strip_attrs(a)
     assert a.x == s
+
+
+def test_whitelist():
+    a = A()
+    a.x = 15
+    a.z = 25
+    a.keep = 'me'
+
+    strip_attrs(a, whitelist=['keep', 'missing'])
+
+    assert a.x == 5
+    assert not hasattr(a, 'z')
+    assert a.keep == 'me'
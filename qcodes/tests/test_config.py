@@ -8,7 +8,7 @@ from unittest.mock import PropertyMock, mock_open
 import jsonschema
 import pytest
 import qcodes
-from qcodes.configuration import Config
+from qcodes.configuration import Config, DotDict
 from qcodes.tests.common import default_config
 
 VALID_JSON = "{}"
@@ -333,3 +333,30 @@ def test_add_and_describe():
                          f"Type: {value_type}. Default: {default}.")
 
         assert desc == expected_desc
+
+
+def test_dotdict_attribute_access():
+    dd = DotDict({'a': {'b': {'c': 1}}, 'd': 2})
+
+    assert dd.d == 2
+    assert dd.a.b.c == 1
+    assert getattr(dd, 'a.b.c') == 1
+    with pytest.raises(KeyError):
+        dd.e
+
+
+def test_dotdict_nested_setitem_and_contains():
+    dd = DotDict()
+    dd['a.b.c'] = 1
+    dd['a.b.d'] = {'e': 2}
+
+    assert isinstance(dd['a'], DotDict)
+    assert isinstance(dd['a.b.d'], DotDict)
+    assert dd['a.b.c'] == 1
+    assert dd.a.b.d.e == 2
+
+    assert 'a.b.c' in dd
+    assert 'a.b.d.e' in dd
+    assert 'a.b.x' not in dd
+    assert 'a.b.c.x' not in dd
+    assert 'x.y' not in dd
@@ -5,6 +5,7 @@ import pytest
 import weakref
 import io
 import contextlib
+import gc
 import re
 
 from qcodes.instrument.base import Instrument, InstrumentBase, find_or_create_instrument
@@ -82,6 +83,18 @@ def test_attr_access(testdummy):
     assert not hasattr(testdummy, 'dac1')
 
 
+def test_close_without_strip_attrs(close_before_and_after):
+    class NoStripDummy(DummyInstrument):
+        _strip_attrs_on_close = False
+
+    instr = NoStripDummy(name='nostrip', gates=['dac1'])
+    instr.close()
+
+    assert hasattr(instr, 'dac1')
+    assert not Instrument.is_valid(instr)
+    assert not Instrument.exist('nostrip')
+
+
 def test_get_idn(testdummy):
     idn = dict(zip(('vendor', 'model', 'serial', 'firmware'),
                    [None, testdummy.name, None, None]))
@@ -112,6 +125,48 @@ def test_add_remove_f_p(testdummy):
     assert isinstance(dac1, Parameter)
 
 
+def test_add_parameters_and_functions(testdummy):
+    testdummy.add_parameters([('p1', dict(get_cmd=None, set_cmd=None)),
+                              ('p2', dict(get_cmd=None, set_cmd=None,
+                                          initial_value=3))])
+    assert isinstance(testdummy.p1, Parameter)
+    assert testdummy.p2() == 3
+
+    testdummy.add_functions([('f1', dict(call_cmd='foo')),
+                             ('f2', dict(call_cmd='bar'))])
+    assert isinstance(testdummy['f1'], Function)
+    assert isinstance(testdummy['f2'], Function)
+
+
+def test_add_parameters_duplicate_adds_nothing(testdummy):
+    with pytest.raises(KeyError, match='Duplicate parameter name dac1'):
+        testdummy.add_parameters([('p1', dict(get_cmd=None)),
+                                  ('dac1', dict(get_cmd=None))])
+    assert 'p1' not in testdummy.parameters
+
+    with pytest.raises(KeyError, match='Duplicate parameter name p2'):
+        testdummy.add_parameters([('p2', dict(get_cmd=None)),
+                                  ('p2', dict(get_cmd=None))])
+    assert 'p2' not in testdummy.parameters
+
+    with pytest.raises(KeyError, match='Duplicate function name f1'):
+        testdummy.add_functions([('f1', dict(call_cmd='foo')),
+                                 ('f1', dict(call_cmd='foo'))])
+    assert 'f1' not in testdummy.functions
+
+
+def test_add_parameters_constructor_error_adds_nothing(testdummy):
+    with pytest.raises(TypeError):
+        testdummy.add_parameters([('p1', dict(get_cmd=None)),
+                                  ('p2', dict(bogus=1))])
+    assert 'p1' not in testdummy.parameters
+
+    with pytest.raises(TypeError):
+        testdummy.add_functions([('f1', dict(call_cmd='foo')),
+                                 ('f2', dict(bogus=1))])
+    assert 'f1' not in testdummy.functions
+
+
 def test_instances(testdummy, parabola):
     instruments = [testdummy, parabola]
     for instrument in instruments:
@@ -130,12 +185,98 @@ def test_instances(testdummy, parabola):
         assert instrument is Instrument.find_instrument(instrument.name)
 
 
+def test_instances_in_creation_order(close_before_and_after):
+    instrs = [DummyInstrument(name=f'ordered_{i}', gates=['dac1'])
+              for i in range(8)]
+    assert DummyInstrument.instances() == instrs
+
+
+def test_instances_of_unhashable_subclass(close_before_and_after):
+    class UnhashableDummy(DummyInstrument):
+        def __eq__(self, other):
+            return self is other
+
+    instr = UnhashableDummy(name='unhashable', gates=['dac1'])
+    assert UnhashableDummy.instances() == [instr]
+    instr.close()
+    assert UnhashableDummy.instances() == []
+
+
+def test_instances_of_subclass_not_in_base(testdummy):
+    class SubDummyInstrument(DummyInstrument):
+        pass
+
+    assert SubDummyInstrument.instances() == []
+    sub = SubDummyInstrument(name='subdummy', gates=['dac1'])
+    try:
+        assert SubDummyInstrument.instances() == [sub]
+        assert DummyInstrument.instances() == [testdummy]
+    finally:
+        sub.close()
+
+
 def test_is_valid(testdummy):
     assert Instrument.is_valid(testdummy)
     testdummy.close()
     assert not Instrument.is_valid(testdummy)
 
 
+def test_remove_instance_with_changed_name(close_before_and_after):
+    instr = DummyInstrument(name='renamed_dummy', gates=['dac1'])
+    assert 'renamed_dummy' in Instrument._all_instruments
+    instr._name = 'other_name'
+    instr.close()
+    assert 'renamed_dummy' not in Instrument._all_instruments
+
+
+def test_remove_instance_after_close_does_not_scan(close_before_and_after,
+                                                    monkeypatch):
+    class CountingDict(dict):
+        scans = 0
+
+        def __iter__(self):
+            self.scans += 1
+            return super().__iter__()
+
+    all_ins = CountingDict()
+    monkeypatch.setattr(Instrument, '_all_instruments', all_ins)
+    others = [DummyInstrument(name=f'other_{i}', gates=['dac1'])
+              for i in range(3)]
+    try:
+        instr = DummyInstrument(name='closed_twice', gates=['dac1'])
+        instr.close()
+        # closing again, e.g. from ``__del__``, must not walk all instruments
+        instr.close()
+        assert all_ins.scans == 0
+    finally:
+        for other in others:
+            other.close()
+    assert all_ins == {}
+
+
+def test_instances_drop_garbage_collected(close_before_and_after):
+    instr = DummyInstrument(name='gc_dummy', gates=['dac1'])
+    assert DummyInstrument.instances() == [instr]
+    del instr
+    gc.collect()
+    assert DummyInstrument.instances() == []
+
+
+def test_all_instruments_record_dropped_without_close(close_before_and_after):
+    class NeverClosedDummy(DummyInstrument):
+        def close(self):
+            pass
+
+    instr = NeverClosedDummy(name='never_closed', gates=['dac1'])
+    assert 'never_closed' in Instrument._all_instruments
+    del instr
+    gc.collect()
+    assert 'never_closed' not in Instrument._all_instruments
+    assert not Instrument.exist('never_closed')
+    with pytest.raises(KeyError, match='never_closed'):
+        Instrument.find_instrument('never_closed')
+
+
 def test_snapshot_value(testdummy):
     testdummy.add_parameter('has_snapshot_value',
                             parameter_class=Parameter,
@@ -45,6 +45,25 @@ class Command:
         NoCommandError: If no cmd is found no_cmd_function is missing.
     """
 
+    # Names of the wrappers below for each (parse_input, parse_output)
+    # combination. These are shared by all commands, so constructing a
+    # command only binds the one wrapper it actually uses.
+    _str_wrappers = {
+        (False, False): 'call_by_str',
+        (False, True): 'call_by_str_parsed_out',
+        (True, False): 'call_by_str_parsed_in',
+        (True, True): 'call_by_str_parsed_in_out',
+        ('multi', False): 'call_by_str_parsed_in2',
+        ('multi', True): 'call_by_str_parsed_in2_out'
+    }
+    _cmd_wrappers = {
+        (False, True): 'call_cmd_parsed_out',
+        (True, False): 'call_cmd_parsed_in',
+        (True, True): 'call_cmd_parsed_in_out',
+        ('multi', False): 'call_cmd_parsed_in2',
+        ('multi', True): 'call_cmd_parsed_in2_out'
+    }
+
     def __init__(self, arg_count, cmd=None, exec_str=None, input_parser=None,
                  output_parser=None, no_cmd_function=None):
 
@@ -81,14 +100,8 @@ class Command:
             self.exec_str = exec_str
 
             if is_function(exec_str, 1):
-                self.exec_function = {  # (parse_input, parse_output)
-                    (False, False): self.call_by_str,
-                    (False, True): self.call_by_str_parsed_out,
-                    (True, False): self.call_by_str_parsed_in,
-                    (True, True): self.call_by_str_parsed_in_out,
-                    ('multi', False): self.call_by_str_parsed_in2,
-                    ('multi', True): self.call_by_str_parsed_in2_out
-                }[(parse_input, parse_output)]
+                self.exec_function = getattr(
+                    self, self._str_wrappers[(parse_input, parse_output)])
 
             elif exec_str is not None:
                 raise TypeError('exec_str must be a function with one arg,' +
@@ -96,14 +109,11 @@ class Command:
 
         elif is_function(cmd, arg_count):
             self._cmd = cmd
-            self.exec_function = {  # (parse_input, parse_output)
-                (False, False): cmd,
-                (False, True): self.call_cmd_parsed_out,
-                (True, False): self.call_cmd_parsed_in,
-                (True, True): self.call_cmd_parsed_in_out,
-                ('multi', False): self.call_cmd_parsed_in2,
-                ('multi', True): self.call_cmd_parsed_in2_out
-            }[(parse_input, parse_output)]
+            if (parse_input, parse_output) == (False, False):
+                self.exec_function = cmd
+            else:
+                self.exec_function = getattr(
+                    self, self._cmd_wrappers[(parse_input, parse_output)])
 
         elif cmd is None:
             if no_cmd_function is not None:
@@ -342,6 +342,21 @@ def wait_secs(finish_clock: float) -> float:
     return delay
 
 
+def _get_delegate(obj: object, name: str) -> Any:
+    """
+    Look up the delegate dict or object ``name`` of ``obj``, or return
+    ``None`` if it does not exist (yet).
+
+    This uses ``object.__getattribute__`` so that a missing delegate does not
+    recurse into ``DelegateAttributes.__getattr__``: delegates themselves are
+    never delegated.
+    """
+    try:
+        return object.__getattribute__(obj, name)
+    except AttributeError:
+        return None
+
+
 class DelegateAttributes:
     """
     Mixin class to create attributes of this object by
@@ -385,7 +400,7 @@ class DelegateAttributes:
                     "dict '{}' has not been created in object '{}'".format(
                         key, self.__class__.__name__))
             try:
-                d = getattr(self, name, None)
+                d = _get_delegate(self, name)
                 if d is not None:
                     return d[key]
             except KeyError:
@@ -397,7 +412,7 @@ class DelegateAttributes:
                     "object '{}' has not been created in object '{}'".format(
                         key, self.__class__.__name__))
             try:
-                obj = getattr(self, name, None)
+                obj = _get_delegate(self, name)
                 if obj is not None:
                     return getattr(obj, key)
             except AttributeError:
@@ -434,10 +449,18 @@ def strip_attrs(obj: object, whitelist: Sequence[str] = ()) -> None:
         whitelist: List of names that are not stripped from the object.
     """
     try:
-        lst = set(list(obj.__dict__.keys())) - set(whitelist)
+        attrs = obj.__dict__
+        if type(attrs) is dict:
+            # clearing and refilling a plain dict is much cheaper than
+            # deleting attributes one by one
+            kept = {key: attrs[key] for key in whitelist if key in attrs}
+            attrs.clear()
+            attrs.update(kept)
+            return
+        lst = set(list(attrs.keys())) - set(whitelist)
         for key in lst:
             try:
-                del obj.__dict__[key]
+                del attrs[key]
             # TODO (giulioungaretti) fix bare-except
             except:
                 pass